@@ -66,8 +66,9 @@ class ViralFashionAgent:
             logger.info(f"✅ Detected {len(trends)} trends")
             
             # Save trends to database
-            for trend in trends:
-                self.db.save_trend(trend)
+            with self.db.transaction():
+                for trend in trends:
+                    self.db.save_trend(trend)
             
             # Step 2: Generate content for each trend
             logger.info("✍️  Step 2: Generating AI content...")
@@ -79,6 +80,9 @@ class ViralFashionAgent:
             
             logger.info(f"✅ Generated {len(content_batch)} video scripts")
             
+            # Authenticate all platforms once up front so uploads skip re-auth
+            self.uploader.authenticate_all()
+            
             # Step 3: Create videos and upload
             successful_uploads = 0
             
@@ -122,13 +126,14 @@ class ViralFashionAgent:
                     )
                     
                     # Save upload results
-                    for platform, url in upload_results.items():
-                        if url:
-                            self.db.save_upload(video_id, platform, {
-                                'url': url,
-                                'content_id': self._extract_content_id(url, platform)
-                            })
-                            successful_uploads += 1
+                    with self.db.transaction():
+                        for platform, url in upload_results.items():
+                            if url:
+                                self.db.save_upload(video_id, platform, {
+                                    'url': url,
+                                    'content_id': self._extract_content_id(url, platform)
+                                })
+                                successful_uploads += 1
                     
                     # Display results
                     logger.info(f"\n📊 Upload Results for Video {i}:")
@@ -173,16 +178,28 @@ class ViralFashionAgent:
         try:
             recent_uploads = self.db.get_recent_uploads(limit=50)
             
+            # Group content IDs by platform so each platform can fetch them in bulk
+            pending = {}
             for upload in recent_uploads:
                 platform = upload['platform']
                 content_id = self._extract_content_id(upload['url'], platform)
                 
                 if content_id and platform in self.uploader.uploaders:
-                    stats = self.uploader.uploaders[platform].get_analytics(content_id)
-                    
-                    if stats:
-                        self.db.update_analytics(upload['id'], stats)
-                        logger.info(f"Updated {platform} analytics: {stats}")
+                    pending.setdefault(platform, {})[content_id] = upload['id']
+            
+            updates = {}
+            for platform, upload_ids in pending.items():
+                uploader = self.uploader.uploaders[platform]
+                analytics = uploader.get_analytics_batch(list(upload_ids))
+                
+                for content_id, stats in analytics.items():
+                    if stats and content_id in upload_ids:
+                        updates[upload_ids[content_id]] = stats
+                        logger.info(f"Fetched {platform} analytics: {stats}")
+            
+            # Write all analytics in one transaction
+            if updates:
+                self.db.update_analytics_batch(updates)
             
             # Show platform performance
             performance = self.db.get_platform_performance()
@@ -40,6 +40,11 @@ else
             pytest -v
             ;;
         
+        fast)
+            echo -e "${YELLOW}Running fast tests (skipping slow)...${NC}"
+            pytest --fast
+            ;;
+        
         coverage)
             echo -e "${YELLOW}Running tests with detailed coverage...${NC}"
             pytest --cov=src --cov-report=term-missing --cov-report=html
@@ -59,8 +64,11 @@ else
         
         parallel)
             echo -e "${YELLOW}Running tests in parallel...${NC}"
-            if command -v pytest-xdist &> /dev/null; then
-                pytest -n auto --cov=src
+            if python -c "import xdist" &> /dev/null; then
+                # loadfile keeps each test module on one worker so module-scoped fixtures are built once
+                pytest -n auto --dist loadfile -m "not serial" --cov=src
+                # Tests marked serial run afterwards in a single process (exit 5 = none collected)
+                pytest -m serial --cov=src --cov-append || [ $? -eq 5 ]
             else
                 echo -e "${RED}pytest-xdist not installed${NC}"
                 echo "Install: pip install pytest-xdist"
@@ -98,6 +106,7 @@ else
             echo "Commands:"
             echo "  (none)     Run all tests with coverage (default)"
             echo "  quick      Run tests without coverage"
+            echo "  fast       Run tests not marked slow"
             echo "  coverage   Run tests with detailed coverage report"
             echo "  watch      Run tests in watch mode"
             echo "  parallel   Run tests in parallel"
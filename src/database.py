@@ -2,10 +2,12 @@
 Database for tracking uploads and analytics
 """
 import sqlite3
+from contextlib import contextmanager
 from typing import Dict, List, Optional
 from datetime import datetime
 import logging
 import json
+import threading
 
 import config
 
@@ -18,6 +20,9 @@ class Database:
     def __init__(self, db_path: str = None):
         self.db_path = db_path or config.DATABASE_PATH
         self._ensure_directory()
+        self._lock = threading.RLock()
+        self._in_transaction = False
+        self._conn = self._connect()
         self._create_tables()
     
     def _ensure_directory(self):
@@ -25,9 +30,44 @@ class Database:
         import os
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
     
+    def _connect(self) -> sqlite3.Connection:
+        """Open the long-lived connection shared by all queries"""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.executescript('''
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA mmap_size=268435456;
+        ''')
+        return conn
+    
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+    
+    @contextmanager
+    def transaction(self):
+        """Group several writes into a single commit
+        
+        Nested calls join the outer transaction, so the individual save/update
+        methods can be used inside it without committing each row.
+        """
+        with self._lock:
+            if self._in_transaction:
+                yield self._conn
+                return
+            
+            self._in_transaction = True
+            try:
+                with self._conn as conn:
+                    yield conn
+            finally:
+                self._in_transaction = False
+    
     def _create_tables(self):
         """Create database tables if they don't exist"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.transaction() as conn:
             cursor = conn.cursor()
             
             # Trends table
@@ -85,12 +125,43 @@ class Database:
                 )
             ''')
             
-            conn.commit()
+            # One analytics row per upload (target of the UPSERT below). Databases
+            # written by the old SELECT-then-INSERT may hold racing duplicates;
+            # keep the newest row per upload so the unique index can be built.
+            # Only needed once: after the index exists no duplicates can appear.
+            cursor.execute('''
+                SELECT 1 FROM sqlite_master
+                WHERE type = 'index' AND name = 'idx_analytics_upload_id'
+            ''')
+            if cursor.fetchone() is None:
+                cursor.execute('''
+                    DELETE FROM analytics
+                    WHERE id NOT IN (SELECT MAX(id) FROM analytics GROUP BY upload_id)
+                ''')
+                cursor.execute('''
+                    CREATE UNIQUE INDEX idx_analytics_upload_id
+                    ON analytics (upload_id)
+                ''')
+            
+            # Indexes matching the filter/sort order of the read queries
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_trends_unused
+                ON trends (used, score DESC, detected_at DESC)
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_uploads_uploaded_at
+                ON uploads (uploaded_at DESC)
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_uploads_status_platform
+                ON uploads (status, platform)
+            ''')
+            
             logger.info("Database tables created/verified")
     
     def save_trend(self, trend: Dict) -> int:
         """Save a detected trend"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.transaction() as conn:
             cursor = conn.cursor()
             cursor.execute('''
                 INSERT INTO trends (source, title, keywords, score)
@@ -101,21 +172,19 @@ class Database:
                 json.dumps(trend.get('keywords', [])),
                 trend.get('score', 0)
             ))
-            conn.commit()
             return cursor.lastrowid
     
     def mark_trend_used(self, trend_id: int):
         """Mark a trend as used"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.transaction() as conn:
             cursor = conn.cursor()
             cursor.execute('UPDATE trends SET used = 1 WHERE id = ?', (trend_id,))
-            conn.commit()
     
     def get_unused_trends(self, limit: int = 10) -> List[Dict]:
         """Get trends that haven't been used yet"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self.transaction() as conn:
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
             cursor.execute('''
                 SELECT * FROM trends
                 WHERE used = 0
@@ -128,7 +197,7 @@ class Database:
     
     def save_video(self, video: Dict, trend_id: int = None) -> int:
         """Save video metadata"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.transaction() as conn:
             cursor = conn.cursor()
             cursor.execute('''
                 INSERT INTO videos (trend_id, script, metadata, file_path)
@@ -139,12 +208,11 @@ class Database:
                 json.dumps(video.get('metadata', {})),
                 video.get('file_path')
             ))
-            conn.commit()
             return cursor.lastrowid
     
     def save_upload(self, video_id: int, platform: str, result: Dict) -> int:
         """Save upload result"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.transaction() as conn:
             cursor = conn.cursor()
             cursor.execute('''
                 INSERT INTO uploads (video_id, platform, content_id, url, status)
@@ -156,48 +224,49 @@ class Database:
                 result.get('url'),
                 'success' if result.get('url') else 'failed'
             ))
-            conn.commit()
             return cursor.lastrowid
     
+    _UPSERT_ANALYTICS = '''
+        INSERT INTO analytics (upload_id, views, likes, comments, shares)
+        VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT (upload_id) DO UPDATE SET
+            views = excluded.views,
+            likes = excluded.likes,
+            comments = excluded.comments,
+            shares = excluded.shares,
+            last_updated = CURRENT_TIMESTAMP
+    '''
+    
+    @staticmethod
+    def _analytics_row(upload_id: int, stats: Dict) -> tuple:
+        """Build the parameter tuple for an analytics UPSERT"""
+        return (
+            upload_id,
+            stats.get('views', 0),
+            stats.get('likes', 0),
+            stats.get('comments', 0),
+            stats.get('shares', 0)
+        )
+    
     def update_analytics(self, upload_id: int, stats: Dict):
         """Update or insert analytics for an upload"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            # Check if analytics exist
-            cursor.execute('SELECT id FROM analytics WHERE upload_id = ?', (upload_id,))
-            existing = cursor.fetchone()
-            
-            if existing:
-                cursor.execute('''
-                    UPDATE analytics
-                    SET views = ?, likes = ?, comments = ?, shares = ?,
-                        last_updated = CURRENT_TIMESTAMP
-                    WHERE upload_id = ?
-                ''', (
-                    stats.get('views', 0),
-                    stats.get('likes', 0),
-                    stats.get('comments', 0),
-                    stats.get('shares', 0),
-                    upload_id
-                ))
-            else:
-                cursor.execute('''
-                    INSERT INTO analytics (upload_id, views, likes, comments, shares)
-                    VALUES (?, ?, ?, ?, ?)
-                ''', (
-                    upload_id,
-                    stats.get('views', 0),
-                    stats.get('likes', 0),
-                    stats.get('comments', 0),
-                    stats.get('shares', 0)
-                ))
-            
-            conn.commit()
+        with self.transaction() as conn:
+            conn.execute(self._UPSERT_ANALYTICS, self._analytics_row(upload_id, stats))
+    
+    def update_analytics_batch(self, updates: Dict[int, Dict]):
+        """Update or insert analytics for many uploads in a single transaction
+        
+        Args:
+            updates: Dict mapping upload ID to its stats
+        """
+        rows = [self._analytics_row(upload_id, stats) for upload_id, stats in updates.items()]
+        
+        with self.transaction() as conn:
+            conn.executemany(self._UPSERT_ANALYTICS, rows)
     
     def get_total_analytics(self) -> Dict:
         """Get aggregate analytics across all platforms"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.transaction() as conn:
             cursor = conn.cursor()
             cursor.execute('''
                 SELECT 
@@ -220,9 +289,9 @@ class Database:
     
     def get_platform_performance(self) -> List[Dict]:
         """Get performance metrics by platform"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self.transaction() as conn:
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
             cursor.execute('''
                 SELECT 
                     u.platform,
@@ -242,9 +311,9 @@ class Database:
     
     def get_recent_uploads(self, limit: int = 20) -> List[Dict]:
         """Get recent uploads with stats"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self.transaction() as conn:
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
             cursor.execute('''
                 SELECT 
                     u.id, u.platform, u.url, u.uploaded_at,
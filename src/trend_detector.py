@@ -14,6 +14,15 @@ import config
 
 logger = logging.getLogger(__name__)
 
+# Substrings that mark text as fashion-related
+FASHION_KEYWORDS = frozenset({
+    'fashion', 'style', 'outfit', 'clothing', 'wear', 'dress', 'shoes',
+    'sneakers', 'streetwear', 'designer', 'brand', 'trend', 'look',
+    'aesthetic', 'fit', 'drip', 'ootd', 'vintage', 'luxury', 'casual',
+    'formal', 'accessories', 'jewelry', 'bag', 'jacket', 'coat', 'pants',
+    'jeans', 'shirt', 'hoodie', 'sweater', 'boots', 'sustainable'
+})
+
 
 class TrendDetector:
     """Detect fashion trends from multiple sources"""
@@ -360,16 +369,8 @@ class TrendDetector:
     
     def _is_fashion_related(self, text: str) -> bool:
         """Check if text is fashion-related"""
-        fashion_keywords = [
-            'fashion', 'style', 'outfit', 'clothing', 'wear', 'dress', 'shoes',
-            'sneakers', 'streetwear', 'designer', 'brand', 'trend', 'look',
-            'aesthetic', 'fit', 'drip', 'ootd', 'vintage', 'luxury', 'casual',
-            'formal', 'accessories', 'jewelry', 'bag', 'jacket', 'coat', 'pants',
-            'jeans', 'shirt', 'hoodie', 'sweater', 'boots', 'sustainable'
-        ]
-        
         text_lower = text.lower()
-        return any(keyword in text_lower for keyword in fashion_keywords)
+        return any(keyword in text_lower for keyword in FASHION_KEYWORDS)
     
     def _deduplicate_trends(self, trends: List[Dict]) -> List[Dict]:
         """Remove duplicate or very similar trends"""
@@ -21,6 +21,7 @@ class MultiPlatformUploader:
     
     def __init__(self):
         self.uploaders = {}
+        self._authenticated = set()
         self._initialize_uploaders()
     
     def _initialize_uploaders(self):
@@ -45,26 +46,75 @@ class MultiPlatformUploader:
             except Exception as e:
                 logger.error(f"Failed to initialize {platform} uploader: {e}")
     
-    def upload_to_all(self, video_path: str, metadata: Dict) -> Dict[str, Optional[str]]:
+    def authenticate_all(self) -> Dict[str, bool]:
+        """
+        Authenticate every platform uploader once, in parallel
+        
+        Platforms that authenticate successfully are remembered so later
+        uploads don't pay the auth round-trip again.
+        
+        Returns:
+            Dict mapping platform name to authentication success
+        """
+        pending = {
+            platform: uploader for platform, uploader in self.uploaders.items()
+            if platform not in self._authenticated
+        }
+        
+        if pending:
+            with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+                futures = {
+                    executor.submit(uploader.authenticate): platform
+                    for platform, uploader in pending.items()
+                }
+                
+                for future in as_completed(futures):
+                    platform = futures[future]
+                    try:
+                        if future.result():
+                            self._authenticated.add(platform)
+                        else:
+                            logger.warning(f"❌ {platform}: Authentication failed")
+                    except Exception as e:
+                        logger.error(f"❌ {platform}: Authentication exception - {e}")
+        
+        return {platform: platform in self._authenticated for platform in self.uploaders}
+    
+    def upload_to_all(
+        self,
+        video_path: str,
+        metadata: Dict,
+        platforms: Optional[List[str]] = None
+    ) -> Dict[str, Optional[str]]:
         """
         Upload video to all enabled platforms
         
         Args:
             video_path: Path to video file
             metadata: Video metadata (title, description, tags)
+            platforms: Optional subset of platforms to upload to (default: all)
         
         Returns:
             Dict mapping platform name to upload URL/ID
         """
         results = {}
         
+        targets = {
+            platform: uploader for platform, uploader in self.uploaders.items()
+            if platforms is None or platform in platforms
+        }
+        
+        if not targets:
+            logger.warning("No platform uploaders available, skipping upload")
+            return results
+        
         logger.info(f"Starting multi-platform upload: {metadata.get('title', 'Untitled')}")
         
-        # Upload to all platforms in parallel
-        with ThreadPoolExecutor(max_workers=len(self.uploaders)) as executor:
+        # Upload to all platforms in parallel, one worker per platform
+        with ThreadPoolExecutor(max_workers=len(targets)) as executor:
             futures = {}
             
-            for platform, uploader in self.uploaders.items():
+            for platform, uploader in targets.items():
                 # Customize metadata for each platform if needed
                 platform_metadata = self._adapt_metadata(metadata, platform)
                 
@@ -2,12 +2,60 @@
 Multi-platform uploader base class
 """
 from abc import ABC, abstractmethod
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
+import functools
 import logging
+import os
+import threading
 
 logger = logging.getLogger(__name__)
 
 
+_probe_locks: Dict[Tuple[str, int, int], threading.Lock] = {}
+_probe_locks_guard = threading.Lock()
+
+
+@functools.lru_cache(maxsize=64)
+def _probe(video_path: str, mtime_ns: int, size: int) -> Tuple[float, int, int]:
+    """
+    Read (duration, width, height) of a video
+    
+    mtime_ns and size are only part of the cache key, so a file rewritten in
+    place is probed again. Call through _probe_once so concurrent callers share
+    one probe; lru_cache alone lets simultaneous misses all run it.
+    """
+    from moviepy.editor import VideoFileClip
+    
+    clip = VideoFileClip(video_path)
+    try:
+        width, height = clip.size
+        return clip.duration, width, height
+    finally:
+        clip.close()
+
+
+def _probe_once(video_path: str, mtime_ns: int, size: int) -> Tuple[float, int, int]:
+    """
+    Probe a video version at most once, even when several threads ask at once
+    
+    upload_to_all validates the same file on every platform in parallel; the
+    per-version lock makes the others wait for the first probe and hit the cache.
+    The lock is dropped from the registry once the probe is done (waiters already
+    hold it), so a long-running scheduler doesn't keep one per video forever.
+    """
+    key = (video_path, mtime_ns, size)
+    with _probe_locks_guard:
+        lock = _probe_locks.setdefault(key, threading.Lock())
+    
+    with lock:
+        try:
+            return _probe(video_path, mtime_ns, size)
+        finally:
+            with _probe_locks_guard:
+                if _probe_locks.get(key) is lock:
+                    del _probe_locks[key]
+
+
 class BasePlatformUploader(ABC):
     """Base class for all platform uploaders"""
     
@@ -39,22 +87,30 @@ class BasePlatformUploader(ABC):
         """Get analytics for uploaded content"""
         pass
     
+    def get_analytics_batch(self, content_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Get analytics for several uploads
+        
+        Platforms with a bulk API override this; the default fetches one by one.
+        
+        Returns:
+            Dict mapping content ID to its analytics
+        """
+        return {content_id: self.get_analytics(content_id) for content_id in content_ids}
+    
     def validate_video(self, video_path: str, max_size_mb: int, max_duration: int) -> bool:
         """Validate video meets platform requirements"""
-        import os
-        from moviepy.editor import VideoFileClip
+        stat = os.stat(video_path)
         
         # Check file size
-        file_size_mb = os.path.getsize(video_path) / (1024 * 1024)
+        file_size_mb = stat.st_size / (1024 * 1024)
         if file_size_mb > max_size_mb:
             self.logger.error(f"Video too large: {file_size_mb:.2f}MB > {max_size_mb}MB")
             return False
         
         # Check duration
         try:
-            clip = VideoFileClip(video_path)
-            duration = clip.duration
-            clip.close()
+            duration, _, _ = _probe_once(video_path, stat.st_mtime_ns, stat.st_size)
             
             if duration > max_duration:
                 self.logger.error(f"Video too long: {duration}s > {max_duration}s")
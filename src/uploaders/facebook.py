@@ -17,6 +17,7 @@ class FacebookUploader(BasePlatformUploader):
         self.page_id = config.FACEBOOK_PAGE_ID
         self.access_token = config.FACEBOOK_ACCESS_TOKEN
         self.api_version = 'v18.0'
+        self.authenticated = False
     
     def authenticate(self) -> bool:
         """Verify Facebook access token"""
@@ -26,6 +27,7 @@ class FacebookUploader(BasePlatformUploader):
             response = requests.get(url, params=params)
             
             if response.status_code == 200:
+                self.authenticated = True
                 self.logger.info("Facebook authentication successful")
                 return True
             else:
@@ -38,8 +40,9 @@ class FacebookUploader(BasePlatformUploader):
     
     def upload(self, video_path: str, metadata: Dict) -> Optional[str]:
         """Upload video as Facebook Reel"""
-        if not self.authenticate():
-            return None
+        if not self.authenticated:
+            if not self.authenticate():
+                return None
         
         platform_config = config.PLATFORMS['facebook']
         if not self.validate_video(
@@ -0,0 +1,44 @@
+"""
+Resumable media upload helpers shared by uploaders
+"""
+import mmap
+
+from googleapiclient.http import MediaFileUpload
+
+
+class MmapFileUpload(MediaFileUpload):
+    """MediaFileUpload that serves chunks from a read-only memory map
+    
+    Chunks are sliced straight out of the page cache instead of going
+    through a seek() + read() pair on the file object for every chunk.
+    """
+    
+    def __init__(self, filename, **kwargs):
+        super().__init__(filename, **kwargs)
+        self._mmap = None
+        if self.size():
+            self._mmap = mmap.mmap(self._fd.fileno(), 0, access=mmap.ACCESS_READ)
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                self._mmap.madvise(mmap.MADV_SEQUENTIAL)
+    
+    def has_stream(self):
+        # Force next_chunk() to use getbytes() rather than the file stream
+        return self._mmap is None
+    
+    def getbytes(self, begin, length):
+        self._prefetch(begin + length, length)
+        return self._mmap[begin:begin + length]
+    
+    def _prefetch(self, offset, length):
+        """Ask the kernel to start reading the next chunk while this one is sent"""
+        if not hasattr(mmap, 'MADV_WILLNEED') or offset >= len(self._mmap):
+            return
+        
+        start = offset - offset % mmap.PAGESIZE  # madvise needs page alignment
+        length = min(length + offset - start, len(self._mmap) - start)
+        self._mmap.madvise(mmap.MADV_WILLNEED, start, length)
+    
+    def __del__(self):
+        if getattr(self, '_mmap', None) is not None:
+            self._mmap.close()
+        super().__del__()
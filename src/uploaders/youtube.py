@@ -1,23 +1,70 @@
 """
 YouTube Shorts uploader
 """
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
+from datetime import datetime, timedelta, timezone
+import functools
 import os
-from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-import pickle
+import tempfile
+import threading
 
 from .base import BasePlatformUploader
 import config
 
+# Google client libraries are heavy to import, so they are loaded on first use
+if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
+
+__all__ = ['YouTubeUploader']
+
+_SHORTS_TAG = '#Shorts'
+_SHORTS_SUFFIX = f"\n\n{_SHORTS_TAG}"
+_TAGS_CHAR_LIMIT = 500  # YouTube limit on the combined length of all tags
+
+# Credentials shared by all uploader instances, keyed by scopes
+_CREDS_CACHE: Dict[str, 'Credentials'] = {}
+_REFRESH_TIMERS: Dict[str, threading.Timer] = {}
+_CREDS_LOCK = threading.Lock()
+
+
+def _limit_tags(tags: List[str]) -> List[str]:
+    """Keep tags in order until YouTube's combined tag length budget is used up"""
+    limited = []
+    used = 0
+    
+    for tag in tags:
+        # YouTube counts a separator per tag and wraps tags containing spaces in quotes
+        used += len(tag) + 1 + (2 if ' ' in tag else 0)
+        if used > _TAGS_CHAR_LIMIT:
+            break
+        limited.append(tag)
+    
+    return limited
+
+
+@functools.lru_cache(maxsize=1)
+def _build_service(creds: 'Credentials'):
+    """Build the YouTube client once per credentials object (refreshes happen in place)"""
+    from googleapiclient.discovery import build
+    
+    # Use the discovery document bundled with googleapiclient instead of fetching it
+    return build(
+        'youtube', 'v3',
+        credentials=creds,
+        cache_discovery=False,
+        static_discovery=True
+    )
+
 
 class YouTubeUploader(BasePlatformUploader):
     """Upload videos to YouTube Shorts"""
     
     SCOPES = ['https://www.googleapis.com/auth/youtube.upload']
+    CHUNK_SIZE = 8 * 1024 * 1024  # Must be a multiple of 256 KiB
+    NUM_RETRIES = 5
+    TOKEN_FILE = 'youtube_token.json'
+    REFRESH_MARGIN = timedelta(minutes=5)
+    ANALYTICS_BATCH_SIZE = 50  # videos.list accepts at most 50 IDs
     
     def __init__(self):
         super().__init__('YouTube')
@@ -25,13 +72,22 @@ class YouTubeUploader(BasePlatformUploader):
     
     def authenticate(self) -> bool:
         """Authenticate with YouTube API"""
-        creds = None
-        token_file = 'youtube_token.pickle'
+        from google_auth_oauthlib.flow import InstalledAppFlow
+        from google.auth.transport.requests import Request
+        from google.oauth2.credentials import Credentials
+        
+        cache_key = ' '.join(self.SCOPES)
+        
+        with _CREDS_LOCK:
+            creds = _CREDS_CACHE.get(cache_key)
         
         # Load existing credentials
-        if os.path.exists(token_file):
-            with open(token_file, 'rb') as token:
-                creds = pickle.load(token)
+        if not creds and os.path.exists(self.TOKEN_FILE):
+            try:
+                creds = Credentials.from_authorized_user_file(self.TOKEN_FILE, self.SCOPES)
+            except ValueError as e:
+                # Unreadable token (e.g. a leftover pickle); fall through to a fresh login
+                self.logger.warning(f"Ignoring invalid YouTube token file: {e}")
         
         # Refresh or get new credentials
         if not creds or not creds.valid:
@@ -46,18 +102,69 @@ class YouTubeUploader(BasePlatformUploader):
                     config.YOUTUBE_CLIENT_SECRETS, self.SCOPES)
                 creds = flow.run_local_server(port=0)
             
-            # Save credentials
-            with open(token_file, 'wb') as token:
-                pickle.dump(creds, token)
+            self._save_credentials(creds)
+        
+        with _CREDS_LOCK:
+            _CREDS_CACHE[cache_key] = creds
+        self._schedule_refresh(cache_key, creds)
         
         try:
-            self.youtube = build('youtube', 'v3', credentials=creds)
+            self.youtube = _build_service(creds)
             self.logger.info("YouTube authentication successful")
             return True
         except Exception as e:
             self.logger.error(f"YouTube authentication failed: {e}")
             return False
     
+    def _save_credentials(self, creds: 'Credentials'):
+        """Persist credentials atomically so concurrent workers never see a partial file"""
+        # A unique temp file per write: the background refresh timer and an
+        # authenticate_all worker can save at the same time in one process
+        fd, tmp_file = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(self.TOKEN_FILE)), suffix='.tmp'
+        )
+        try:
+            with os.fdopen(fd, 'w') as token:
+                token.write(creds.to_json())
+            os.replace(tmp_file, self.TOKEN_FILE)
+        except BaseException:
+            os.unlink(tmp_file)
+            raise
+    
+    def _schedule_refresh(self, cache_key: str, creds: 'Credentials'):
+        """Refresh credentials in the background shortly before they expire"""
+        if not creds.refresh_token or not isinstance(creds.expiry, datetime):
+            return
+        
+        # google-auth stores expiry as naive UTC
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        delay = (creds.expiry - now - self.REFRESH_MARGIN).total_seconds()
+        
+        timer = threading.Timer(max(delay, 0), self._refresh_credentials, args=(cache_key, creds))
+        timer.daemon = True
+        
+        with _CREDS_LOCK:
+            previous = _REFRESH_TIMERS.get(cache_key)
+            if previous:
+                previous.cancel()
+            _REFRESH_TIMERS[cache_key] = timer
+        
+        timer.start()
+    
+    def _refresh_credentials(self, cache_key: str, creds: 'Credentials'):
+        """Background refresh of cached credentials"""
+        from google.auth.transport.requests import Request
+        
+        try:
+            creds.refresh(Request())
+            self._save_credentials(creds)
+            self.logger.info("YouTube credentials refreshed")
+        except Exception as e:
+            self.logger.error(f"YouTube credential refresh failed: {e}")
+            return
+        
+        self._schedule_refresh(cache_key, creds)
+    
     def upload(self, video_path: str, metadata: Dict) -> Optional[str]:
         """Upload video as YouTube Short"""
         if not self.youtube:
@@ -76,11 +183,11 @@ class YouTubeUploader(BasePlatformUploader):
         # Prepare metadata
         title = metadata.get('title', 'Fashion Trend')[:100]  # YouTube max 100 chars
         description = metadata.get('description', '')
-        tags = metadata.get('tags', [])[:500]  # Max 500 chars total
+        tags = _limit_tags(metadata.get('tags', []))
         
         # Add #Shorts to description to mark as Short
-        if '#Shorts' not in description:
-            description = f"{description}\n\n#Shorts"
+        if _SHORTS_TAG not in description:
+            description += _SHORTS_SUFFIX
         
         body = {
             'snippet': {
@@ -96,9 +203,11 @@ class YouTubeUploader(BasePlatformUploader):
         }
         
         try:
-            media = MediaFileUpload(
+            from .media_upload import MmapFileUpload
+            
+            media = MmapFileUpload(
                 video_path,
-                chunksize=-1,
+                chunksize=self.CHUNK_SIZE,
                 resumable=True,
                 mimetype='video/mp4'
             )
@@ -111,7 +220,7 @@ class YouTubeUploader(BasePlatformUploader):
             
             response = None
             while response is None:
-                status, response = request.next_chunk()
+                status, response = request.next_chunk(num_retries=self.NUM_RETRIES)
                 if status:
                     self.logger.info(f"Upload progress: {int(status.progress() * 100)}%")
             
@@ -126,24 +235,34 @@ class YouTubeUploader(BasePlatformUploader):
     
     def get_analytics(self, video_id: str) -> Dict:
         """Get video analytics"""
+        return self.get_analytics_batch([video_id]).get(video_id, {})
+    
+    def get_analytics_batch(self, video_ids: List[str]) -> Dict[str, Dict]:
+        """Get analytics for many videos, up to 50 IDs per API request"""
+        analytics = {}
+        
         if not self.youtube:
-            return {}
+            return analytics
         
-        try:
-            response = self.youtube.videos().list(
-                part='statistics,snippet',
-                id=video_id
-            ).execute()
+        for start in range(0, len(video_ids), self.ANALYTICS_BATCH_SIZE):
+            batch = video_ids[start:start + self.ANALYTICS_BATCH_SIZE]
             
-            if response['items']:
-                stats = response['items'][0]['statistics']
-                return {
+            try:
+                response = self.youtube.videos().list(
+                    part='statistics',
+                    id=','.join(batch)
+                ).execute()
+            except Exception as e:
+                self.logger.error(f"Failed to get analytics: {e}")
+                continue
+            
+            for item in response.get('items', []):
+                stats = item['statistics']
+                analytics[item['id']] = {
                     'views': int(stats.get('viewCount', 0)),
                     'likes': int(stats.get('likeCount', 0)),
                     'comments': int(stats.get('commentCount', 0)),
                     'platform': 'youtube'
                 }
-        except Exception as e:
-            self.logger.error(f"Failed to get analytics: {e}")
         
-        return {}
+        return analytics
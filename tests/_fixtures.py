@@ -0,0 +1,42 @@
+"""Plain sample data and helpers shared by tests and conftest fixtures
+
+Treat the sample data as read-only; tests that modify sample data should use
+the conftest fixtures, which hand out fresh copies.
+"""
+from unittest.mock import Mock
+
+SAMPLE_TREND = {
+    'source': 'reddit',
+    'title': 'Sustainable Fashion Trends 2025',
+    'description': 'Eco-friendly fashion is taking over',
+    'keywords': ['sustainable', 'fashion', 'eco-friendly'],
+    'score': 150,
+    'url': 'https://reddit.com/r/fashion/test',
+    'timestamp': '2025-11-19T10:00:00'
+}
+
+SAMPLE_METADATA = {
+    'title': 'Top 3 Sustainable Fashion Tips',
+    'description': 'Learn how to build an eco-friendly wardrobe',
+    'tags': ['fashion', 'sustainable', 'ecofriendly', 'style', 'ootd'],
+    'hashtags': ['#fashion', '#sustainable', '#ecofriendly'],
+    'keywords': ['sustainable fashion', 'eco-friendly', 'wardrobe']
+}
+
+SAMPLE_SCRIPT = """Did you know sustainable fashion is trending?
+
+Here are 3 tips:
+• Buy second-hand clothing
+• Choose natural fabrics
+• Support ethical brands
+
+Save this for later!"""
+
+
+def make_response(status=200, json_body=None, content=b''):
+    """Build a mocked requests response"""
+    response = Mock(spec_set=['status_code', 'json', 'content'])
+    response.status_code = status
+    response.json = Mock(return_value=json_body or {})
+    response.content = content
+    return response
@@ -1,60 +1,90 @@
 """Pytest configuration and fixtures"""
 import os
+import re
 import sys
 import pytest
-from unittest.mock import Mock, MagicMock
+from unittest.mock import Mock, MagicMock, patch
 import tempfile
-import shutil
+import copy
+
+from ._fixtures import SAMPLE_TREND, SAMPLE_METADATA, SAMPLE_SCRIPT
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    """Register custom markers and turn on pytest-socket's network guard
+    
+    pytest does not read the [tool:pytest] section of pytest.ini, so neither can live
+    in its addopts. Runs before pytest-socket's own pytest_configure reads the options;
+    the plugin then blocks sockets in every test's setup, before any fixture is built,
+    and tests opt out with @pytest.mark.enable_socket. Unix sockets stay allowed for asyncio.
+    """
+    config.option.disable_socket = True
+    config.option.allow_unix_socket = True
+    config.addinivalue_line(
+        'markers', 'serial: not safe to run under pytest-xdist; run in a separate single-process pass')
+    config.addinivalue_line(
+        'markers', 'slow: full-pipeline or integration test; skipped with --fast')
+
+
+def pytest_addoption(parser):
+    """Register the --fast option for inner-loop runs"""
+    parser.addoption(
+        '--fast', action='store_true', default=False,
+        help='skip tests marked slow'
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip slow tests when running with --fast"""
+    if not config.getoption('--fast'):
+        return
+    
+    skip_slow = pytest.mark.skip(reason='slow test skipped by --fast')
+    for item in items:
+        if 'slow' in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _no_sleep():
+    """Skip real sleeps (upload staggering, UI waits) for the whole session"""
+    with patch('time.sleep'):
+        yield
+
+
+@pytest.fixture(scope="session")
+def session_temp_dir(tmp_path_factory):
+    """Create temporary directory shared by the whole test session (pytest prunes old runs)"""
+    return str(tmp_path_factory.mktemp('session'))
+
+
 @pytest.fixture
-def temp_dir():
-    """Create temporary directory for tests"""
-    temp_path = tempfile.mkdtemp()
-    yield temp_path
-    shutil.rmtree(temp_path, ignore_errors=True)
+def temp_dir(request, session_temp_dir):
+    """Create a per-test directory inside the session directory"""
+    prefix = re.sub(r'\W+', '_', request.node.name)[:50]
+    return tempfile.mkdtemp(prefix=f"{prefix}-", dir=session_temp_dir)
 
 
 @pytest.fixture
 def sample_trend():
     """Sample trend data for testing"""
-    return {
-        'source': 'reddit',
-        'title': 'Sustainable Fashion Trends 2025',
-        'description': 'Eco-friendly fashion is taking over',
-        'keywords': ['sustainable', 'fashion', 'eco-friendly'],
-        'score': 150,
-        'url': 'https://reddit.com/r/fashion/test',
-        'timestamp': '2025-11-19T10:00:00'
-    }
+    return copy.deepcopy(SAMPLE_TREND)
 
 
 @pytest.fixture
 def sample_metadata():
     """Sample video metadata for testing"""
-    return {
-        'title': 'Top 3 Sustainable Fashion Tips',
-        'description': 'Learn how to build an eco-friendly wardrobe',
-        'tags': ['fashion', 'sustainable', 'ecofriendly', 'style', 'ootd'],
-        'hashtags': ['#fashion', '#sustainable', '#ecofriendly'],
-        'keywords': ['sustainable fashion', 'eco-friendly', 'wardrobe']
-    }
+    return copy.deepcopy(SAMPLE_METADATA)
 
 
 @pytest.fixture
 def sample_script():
     """Sample video script for testing"""
-    return """Did you know sustainable fashion is trending?
-
-Here are 3 tips:
-• Buy second-hand clothing
-• Choose natural fabrics
-• Support ethical brands
-
-Save this for later!"""
+    return SAMPLE_SCRIPT
 
 
 @pytest.fixture
@@ -67,6 +97,16 @@ def mock_groq_client():
     return mock
 
 
+@pytest.fixture(scope="module")
+def mock_groq_client_module():
+    """Mock Groq API client shared by all tests in a module"""
+    mock = Mock()
+    mock_response = Mock()
+    mock_response.choices = [Mock(message=Mock(content='Generated script content'))]
+    mock.chat.completions.create.return_value = mock_response
+    return mock
+
+
 @pytest.fixture
 def mock_video_clip():
     """Mock MoviePy VideoFileClip"""
@@ -85,16 +125,26 @@ def mock_audio_clip():
     return mock
 
 
-@pytest.fixture
-def test_video_path(temp_dir):
-    """Create a dummy video file for testing"""
-    video_path = os.path.join(temp_dir, 'test_video.mp4')
+@pytest.fixture(scope="session")
+def test_video_path(session_temp_dir):
+    """Create a dummy video file once per session (tests must not modify it)"""
+    video_path = os.path.join(session_temp_dir, 'test_video.mp4')
     # Create empty file
     with open(video_path, 'wb') as f:
         f.write(b'\x00' * 1024)  # 1KB dummy file
     return video_path
 
 
+@pytest.fixture(scope="session")
+def large_video(session_temp_dir):
+    """Create an 11MB sparse dummy video once per session (over the 10MB test limit)"""
+    video_path = os.path.join(session_temp_dir, 'large.mp4')
+    open(video_path, 'wb').close()
+    # Extending with truncate only updates metadata; no data blocks are written
+    os.truncate(video_path, 11 * 1024 * 1024)
+    return video_path
+
+
 @pytest.fixture
 def mock_database(temp_dir):
     """Create temporary test database"""
@@ -6,13 +6,30 @@ import json
 from src.content_generator import ContentGenerator
 
 
+@pytest.fixture(autouse=True, scope="module")
+def _patch_groq(mock_groq_client_module):
+    """Patch the Groq client once for the whole module"""
+    patcher = patch('src.content_generator.Groq', return_value=mock_groq_client_module)
+    mock_groq_class = patcher.start()
+    yield mock_groq_class
+    patcher.stop()
+
+
+@pytest.fixture(scope="class")
+def generator(_patch_groq):
+    """Create ContentGenerator instance with mocked Groq, once per class"""
+    return ContentGenerator()
+
+
 class TestContentGenerator:
     
-    @pytest.fixture
-    def generator(self, mock_groq_client):
-        """Create ContentGenerator instance with mocked Groq"""
-        with patch('src.content_generator.Groq', return_value=mock_groq_client):
-            return ContentGenerator()
+    @pytest.fixture(autouse=True)
+    def mock_groq_client(self, mock_groq_client_module):
+        """Shared Groq mock with call history and per-test overrides cleared"""
+        mock_groq_client_module.reset_mock(side_effect=True)
+        response = mock_groq_client_module.chat.completions.create.return_value
+        response.choices[0].message.content = 'Generated script content'
+        return mock_groq_client_module
     
     def test_initialization(self, generator):
         """Test ContentGenerator initialization"""
@@ -119,10 +136,9 @@ class TestContentGenerator:
     def test_optimize_for_tiktok(self, generator, sample_metadata):
         """Test TikTok metadata optimization"""
         long_description = 'A' * 200
-        metadata = sample_metadata.copy()
-        metadata['description'] = long_description
+        sample_metadata['description'] = long_description
         
-        optimized = generator.optimize_for_platform(metadata, 'tiktok')
+        optimized = generator.optimize_for_platform(sample_metadata, 'tiktok')
         
         assert len(optimized['description']) <= 105  # 100 + "..."
     
@@ -136,10 +152,9 @@ class TestContentGenerator:
     def test_optimize_for_twitter(self, generator, sample_metadata):
         """Test Twitter metadata optimization"""
         long_description = 'A' * 300
-        metadata = sample_metadata.copy()
-        metadata['description'] = long_description
+        sample_metadata['description'] = long_description
         
-        optimized = generator.optimize_for_platform(metadata, 'twitter')
+        optimized = generator.optimize_for_platform(sample_metadata, 'twitter')
         
         # Should be truncated
         assert len(optimized['description']) <= 250
@@ -2,6 +2,7 @@
 import pytest
 import os
 import json
+import sqlite3
 from datetime import datetime
 
 from src.database import Database
@@ -12,7 +13,9 @@ class TestDatabase:
     @pytest.fixture
     def db(self, mock_database):
         """Create test database instance"""
-        return Database(db_path=mock_database)
+        database = Database(db_path=mock_database)
+        yield database
+        database.close()
     
     def test_initialization(self, db):
         """Test database initialization"""
@@ -21,7 +24,6 @@ class TestDatabase:
     
     def test_tables_created(self, db):
         """Test all tables are created"""
-        import sqlite3
         with sqlite3.connect(db.db_path) as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
@@ -32,6 +34,65 @@ class TestDatabase:
             assert 'uploads' in tables
             assert 'analytics' in tables
     
+    def test_indexes_created(self, db):
+        """Test query indexes are created"""
+        rows = db._conn.execute("SELECT name FROM sqlite_master WHERE type='index'").fetchall()
+        indexes = [row[0] for row in rows]
+        
+        assert 'idx_analytics_upload_id' in indexes
+        assert 'idx_trends_unused' in indexes
+        assert 'idx_uploads_uploaded_at' in indexes
+        assert 'idx_uploads_status_platform' in indexes
+    
+    def test_duplicate_analytics_rows_collapsed(self, mock_database):
+        """Test opening a database with duplicate analytics rows keeps the newest one"""
+        with sqlite3.connect(mock_database) as conn:
+            conn.execute('''
+                CREATE TABLE analytics (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    upload_id INTEGER NOT NULL,
+                    views INTEGER DEFAULT 0,
+                    likes INTEGER DEFAULT 0,
+                    comments INTEGER DEFAULT 0,
+                    shares INTEGER DEFAULT 0,
+                    revenue REAL DEFAULT 0.0,
+                    last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            conn.executemany(
+                'INSERT INTO analytics (upload_id, views) VALUES (?, ?)',
+                [(1, 100), (1, 200), (2, 50)]
+            )
+        conn.close()
+        
+        database = Database(db_path=mock_database)
+        try:
+            rows = database._conn.execute(
+                'SELECT upload_id, views FROM analytics ORDER BY upload_id'
+            ).fetchall()
+        finally:
+            database.close()
+        
+        assert [tuple(row) for row in rows] == [(1, 200), (2, 50)]
+    
+    def test_reopen_existing_database(self, db, sample_script, sample_metadata):
+        """Test reopening a database that already has the analytics index keeps its data"""
+        video_id = db.save_video({'script': sample_script, 'metadata': sample_metadata})
+        upload_id = db.save_upload(video_id, 'youtube', {'url': 'test'})
+        db.update_analytics(upload_id, {'views': 100})
+        
+        reopened = Database(db_path=db.db_path)
+        try:
+            assert reopened.get_total_analytics()['total_views'] == 100
+        finally:
+            reopened.close()
+    
+    def test_wal_journal_mode(self, db):
+        """Test connection uses write-ahead logging"""
+        mode = db._conn.execute('PRAGMA journal_mode').fetchone()[0]
+        
+        assert mode == 'wal'
+    
     def test_save_trend(self, db, sample_trend):
         """Test saving a trend"""
         trend_id = db.save_trend(sample_trend)
@@ -135,6 +196,42 @@ class TestDatabase:
         assert total_stats['total_views'] == 200
         assert total_stats['total_likes'] == 10
     
+    def test_update_analytics_batch(self, db, sample_script, sample_metadata):
+        """Test batch analytics upsert"""
+        video_data = {
+            'script': sample_script,
+            'metadata': sample_metadata,
+            'file_path': '/path/to/video.mp4'
+        }
+        video_id = db.save_video(video_data)
+        first_id = db.save_upload(video_id, 'youtube', {'url': 'yt_test'})
+        second_id = db.save_upload(video_id, 'tiktok', {'url': 'tt_test'})
+        db.update_analytics(first_id, {'views': 10})
+        
+        db.update_analytics_batch({
+            first_id: {'views': 100, 'likes': 5},
+            second_id: {'views': 200, 'likes': 10}
+        })
+        
+        total_stats = db.get_total_analytics()
+        assert total_stats['total_views'] == 300
+        assert total_stats['total_uploads'] == 2
+    
+    def test_transaction_rolls_back_on_error(self, db, sample_trend):
+        """Test that a failed transaction discards all of its writes"""
+        with pytest.raises(RuntimeError):
+            with db.transaction():
+                db.save_trend(sample_trend)
+                db.save_trend(sample_trend)
+                raise RuntimeError("boom")
+        
+        assert db.get_unused_trends() == []
+        
+        with db.transaction():
+            db.save_trend(sample_trend)
+        
+        assert len(db.get_unused_trends()) == 1
+    
     def test_get_total_analytics_empty(self, db):
         """Test total analytics with no data"""
         stats = db.get_total_analytics()
@@ -152,14 +249,15 @@ class TestDatabase:
             'file_path': '/path/to/video.mp4'
         }
         
-        for i in range(3):
-            video_id = db.save_video(video_data)
-            upload_id = db.save_upload(video_id, 'youtube', {'url': f'test{i}'})
-            db.update_analytics(upload_id, {
-                'views': 100 * (i + 1),
-                'likes': 10 * (i + 1),
-                'comments': i + 1
-            })
+        with db.transaction():
+            for i in range(3):
+                video_id = db.save_video(video_data)
+                upload_id = db.save_upload(video_id, 'youtube', {'url': f'test{i}'})
+                db.update_analytics(upload_id, {
+                    'views': 100 * (i + 1),
+                    'likes': 10 * (i + 1),
+                    'comments': i + 1
+                })
         
         stats = db.get_total_analytics()
         
@@ -176,13 +274,14 @@ class TestDatabase:
         }
         
         # Add uploads for different platforms
-        video_id = db.save_video(video_data)
-        
-        youtube_id = db.save_upload(video_id, 'youtube', {'url': 'yt_test'})
-        tiktok_id = db.save_upload(video_id, 'tiktok', {'url': 'tt_test'})
-        
-        db.update_analytics(youtube_id, {'views': 1000, 'likes': 50})
-        db.update_analytics(tiktok_id, {'views': 2000, 'likes': 100})
+        with db.transaction():
+            video_id = db.save_video(video_data)
+            
+            youtube_id = db.save_upload(video_id, 'youtube', {'url': 'yt_test'})
+            tiktok_id = db.save_upload(video_id, 'tiktok', {'url': 'tt_test'})
+            
+            db.update_analytics(youtube_id, {'views': 1000, 'likes': 50})
+            db.update_analytics(tiktok_id, {'views': 2000, 'likes': 100})
         
         performance = db.get_platform_performance()
         
@@ -201,9 +300,10 @@ class TestDatabase:
             'file_path': '/path/to/video.mp4'
         }
         
-        for i in range(5):
-            video_id = db.save_video(video_data)
-            db.save_upload(video_id, 'youtube', {'url': f'test{i}'})
+        with db.transaction():
+            for i in range(5):
+                video_id = db.save_video(video_data)
+                db.save_upload(video_id, 'youtube', {'url': f'test{i}'})
         
         recent = db.get_recent_uploads(limit=3)
         
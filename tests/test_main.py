@@ -1,23 +1,50 @@
 """Tests for main orchestrator"""
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, call, create_autospec
 import sys
+from contextlib import ExitStack
 
 from main import ViralFashionAgent
+from main import main as main_entry
+from src.trend_detector import TrendDetector
+from src.content_generator import ContentGenerator
+from src.media_creator import MediaCreator
+from src.uploaders import MultiPlatformUploader
+from src.database import Database
+from ._fixtures import SAMPLE_TREND, SAMPLE_METADATA, SAMPLE_SCRIPT
 
+_TWO_TRENDS = [SAMPLE_TREND, SAMPLE_TREND]
+_DEPENDENCIES = (TrendDetector, ContentGenerator, MediaCreator, MultiPlatformUploader, Database)
 
-class TestViralFashionAgent:
+
+@pytest.fixture(scope="class")
+def _patched():
+    """Install spec'd dependency class mocks and their autospec'd instances once per test class"""
+    mocks = {
+        cls.__name__: MagicMock(spec=cls, return_value=create_autospec(cls, instance=True))
+        for cls in _DEPENDENCIES
+    }
     
-    @pytest.fixture
-    def agent(self):
-        """Create ViralFashionAgent with mocked dependencies"""
-        with patch('main.TrendDetector'), \
-             patch('main.ContentGenerator'), \
-             patch('main.MediaCreator'), \
-             patch('main.MultiPlatformUploader'), \
-             patch('main.Database'), \
-             patch('main.os.makedirs'):
-            return ViralFashionAgent()
+    with ExitStack() as stack:
+        stack.enter_context(patch.multiple('main', **mocks))
+        stack.enter_context(patch('main.os.makedirs'))
+        yield mocks
+
+
+@pytest.fixture
+def agent(_patched):
+    """Create ViralFashionAgent with its dependency mocks reset to a clean state
+    
+    The class mocks keep their return_value (the shared autospec'd instance); only the
+    instances' configured return values and side effects are cleared.
+    """
+    for mock_class in _patched.values():
+        mock_class.reset_mock(side_effect=True)
+        mock_class.return_value.reset_mock(return_value=True, side_effect=True)
+    return ViralFashionAgent()
+
+
+class TestViralFashionAgent:
     
     def test_initialization(self, agent):
         """Test agent initialization"""
@@ -27,42 +54,26 @@ class TestViralFashionAgent:
         assert agent.uploader is not None
         assert agent.db is not None
     
-    def test_extract_content_id_youtube(self, agent):
-        """Test extracting YouTube video ID"""
-        url = 'https://youtube.com/shorts/ABC123'
-        content_id = agent._extract_content_id(url, 'youtube')
-        
-        assert content_id == 'ABC123'
-    
-    def test_extract_content_id_instagram(self, agent):
-        """Test extracting Instagram reel code"""
-        url = 'https://www.instagram.com/reel/XYZ789/'
-        content_id = agent._extract_content_id(url, 'instagram')
-        
-        assert content_id == 'XYZ789'
-    
-    def test_extract_content_id_twitter(self, agent):
-        """Test extracting Twitter tweet ID"""
-        url = 'https://twitter.com/user/status/12345678'
-        content_id = agent._extract_content_id(url, 'twitter')
-        
-        assert content_id == '12345678'
-    
-    def test_extract_content_id_invalid(self, agent):
-        """Test content ID extraction with invalid URL"""
-        content_id = agent._extract_content_id(None, 'youtube')
-        assert content_id is None
+    @pytest.mark.parametrize("url,platform,expected", [
+        ('https://youtube.com/shorts/ABC123', 'youtube', 'ABC123'),
+        ('https://www.instagram.com/reel/XYZ789/', 'instagram', 'XYZ789'),
+        ('https://twitter.com/user/status/12345678', 'twitter', '12345678'),
+        (None, 'youtube', None),  # invalid URL
+    ])
+    def test_extract_content_id(self, agent, url, platform, expected):
+        """Test extracting the platform content ID from an upload URL"""
+        assert agent._extract_content_id(url, platform) == expected
     
     @patch('main.config.DAILY_VIDEOS_COUNT', 2)
-    def test_daily_workflow_success(self, agent, sample_trend, sample_script, sample_metadata):
+    def test_daily_workflow_success(self, agent):
         """Test successful daily workflow"""
         # Mock trend detection
-        agent.trend_detector.get_fashion_trends.return_value = [sample_trend, sample_trend]
+        agent.trend_detector.get_fashion_trends.return_value = _TWO_TRENDS
         
         # Mock content generation
         agent.content_generator.generate_batch_content.return_value = [
-            {'script': sample_script, 'metadata': sample_metadata, 'trend': sample_trend, 'status': 'ready'},
-            {'script': sample_script, 'metadata': sample_metadata, 'trend': sample_trend, 'status': 'ready'}
+            {'script': SAMPLE_SCRIPT, 'metadata': SAMPLE_METADATA, 'trend': SAMPLE_TREND, 'status': 'ready'},
+            {'script': SAMPLE_SCRIPT, 'metadata': SAMPLE_METADATA, 'trend': SAMPLE_TREND, 'status': 'ready'}
         ]
         
         # Mock video creation
@@ -85,12 +96,11 @@ class TestViralFashionAgent:
             'total_uploads': 2
         }
         
-        with patch('main.time.sleep'):  # Skip sleep delays
-            agent.daily_workflow()
+        agent.daily_workflow()
         
         # Verify calls
-        agent.trend_detector.get_fashion_trends.assert_called_once()
-        agent.content_generator.generate_batch_content.assert_called_once()
+        assert agent.trend_detector.get_fashion_trends.call_count == 1
+        assert agent.content_generator.generate_batch_content.call_count == 1
         assert agent.media_creator.create_video.call_count == 2
     
     def test_daily_workflow_no_trends(self, agent):
@@ -102,9 +112,9 @@ class TestViralFashionAgent:
         # Should abort early
         agent.content_generator.generate_batch_content.assert_not_called()
     
-    def test_daily_workflow_content_generation_failure(self, agent, sample_trend):
+    def test_daily_workflow_content_generation_failure(self, agent):
         """Test daily workflow with content generation failure"""
-        agent.trend_detector.get_fashion_trends.return_value = [sample_trend]
+        agent.trend_detector.get_fashion_trends.return_value = [SAMPLE_TREND]
         agent.content_generator.generate_batch_content.return_value = []
         
         agent.daily_workflow()
@@ -112,11 +122,11 @@ class TestViralFashionAgent:
         # Should abort after content generation
         agent.media_creator.create_video.assert_not_called()
     
-    def test_daily_workflow_video_creation_failure(self, agent, sample_trend, sample_script, sample_metadata):
+    def test_daily_workflow_video_creation_failure(self, agent):
         """Test daily workflow handles video creation failure"""
-        agent.trend_detector.get_fashion_trends.return_value = [sample_trend]
+        agent.trend_detector.get_fashion_trends.return_value = [SAMPLE_TREND]
         agent.content_generator.generate_batch_content.return_value = [
-            {'script': sample_script, 'metadata': sample_metadata, 'trend': sample_trend}
+            {'script': SAMPLE_SCRIPT, 'metadata': SAMPLE_METADATA, 'trend': SAMPLE_TREND}
         ]
         agent.media_creator.create_video.return_value = False
         agent.db.get_total_analytics.return_value = {'total_views': 0}
@@ -124,7 +134,7 @@ class TestViralFashionAgent:
         agent.daily_workflow()
         
         # Should continue despite failure
-        agent.media_creator.create_video.assert_called_once()
+        assert agent.media_creator.create_video.call_count == 1
     
     def test_update_analytics(self, agent):
         """Test analytics update"""
@@ -137,9 +147,11 @@ class TestViralFashionAgent:
         ]
         
         mock_youtube_uploader = Mock()
-        mock_youtube_uploader.get_analytics.return_value = {
-            'views': 1000,
-            'likes': 50
+        mock_youtube_uploader.get_analytics_batch.return_value = {
+            'ABC123': {
+                'views': 1000,
+                'likes': 50
+            }
         }
         agent.uploader.uploaders = {'youtube': mock_youtube_uploader}
         
@@ -147,7 +159,8 @@ class TestViralFashionAgent:
         
         agent.update_analytics()
         
-        agent.db.update_analytics.assert_called()
+        assert mock_youtube_uploader.get_analytics_batch.call_args_list == [call(['ABC123'])]
+        assert agent.db.update_analytics_batch.call_args_list == [call({1: {'views': 1000, 'likes': 50}})]
     
     def test_generate_report(self, agent):
         """Test report generation"""
@@ -182,39 +195,21 @@ class TestViralFashionAgent:
 
 class TestMainFunction:
     
-    @patch('main.ViralFashionAgent')
-    def test_main_test_command(self, mock_agent_class):
-        """Test main with 'test' command"""
-        mock_agent = Mock()
-        mock_agent_class.return_value = mock_agent
-        
-        with patch.object(sys, 'argv', ['main.py', 'test']):
-            from main import main
-            main()
-        
-        mock_agent.daily_workflow.assert_called_once()
-    
-    @patch('main.ViralFashionAgent')
-    def test_main_analytics_command(self, mock_agent_class):
-        """Test main with 'analytics' command"""
-        mock_agent = Mock()
-        mock_agent_class.return_value = mock_agent
-        
-        with patch.object(sys, 'argv', ['main.py', 'analytics']):
-            from main import main
-            main()
-        
-        mock_agent.update_analytics.assert_called_once()
-        mock_agent.generate_report.assert_called_once()
+    @pytest.fixture
+    def mock_agent(self):
+        """Patch ViralFashionAgent and return the instance main() will create"""
+        with patch('main.ViralFashionAgent') as mock_agent_class:
+            yield mock_agent_class.return_value
     
-    @patch('main.ViralFashionAgent')
-    def test_main_report_command(self, mock_agent_class):
-        """Test main with 'report' command"""
-        mock_agent = Mock()
-        mock_agent_class.return_value = mock_agent
-        
-        with patch.object(sys, 'argv', ['main.py', 'report']):
-            from main import main
-            main()
-        
-        mock_agent.generate_report.assert_called_once()
+    @pytest.mark.parametrize("command,methods", [
+        ('test', ['daily_workflow']),
+        ('analytics', ['update_analytics', 'generate_report']),
+        ('report', ['generate_report']),
+    ])
+    def test_main_command(self, mock_agent, command, methods):
+        """Test main dispatches each command to the agent"""
+        with patch.object(sys, 'argv', ['main.py', command]):
+            main_entry()
+        
+        for method in methods:
+            assert getattr(mock_agent, method).call_count == 1
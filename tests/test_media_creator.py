@@ -1,50 +1,54 @@
 """Tests for MediaCreator"""
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch
 import os
 
+from moviepy.editor import AudioFileClip, VideoFileClip
+
+import src.media_creator as _mc
 from src.media_creator import MediaCreator
+from ._fixtures import make_response
+
+
+def _chainable(*methods):
+    """Build a clip mock whose listed methods return the mock itself"""
+    clip = Mock(spec_set=list(methods))
+    for name in methods:
+        getattr(clip, name).return_value = clip
+    return clip
+
+
+@pytest.fixture(scope="module")
+def creator():
+    """Create MediaCreator instance, once per module (tests only patch it temporarily)"""
+    return MediaCreator()
 
 
 class TestMediaCreator:
     
-    @pytest.fixture
-    def creator(self):
-        """Create MediaCreator instance"""
-        return MediaCreator()
-    
     def test_initialization(self, creator):
         """Test MediaCreator initialization"""
         assert creator.tts_engine == 'edge'
         assert creator.pexels_key is not None
     
-    def test_get_video_specs_vertical(self, creator):
-        """Test vertical video specs"""
-        specs = creator._get_video_specs('9:16')
-        
-        assert specs['width'] == 1080
-        assert specs['height'] == 1920
+    @pytest.mark.parametrize("ratio,width,height", [
+        ('9:16', 1080, 1920),  # vertical
+        ('1:1', 1080, 1080),   # square
+        ('16:9', 1920, 1080),  # horizontal
+    ])
+    def test_get_video_specs(self, creator, ratio, width, height):
+        """Test video specs for each aspect ratio"""
+        specs = creator._get_video_specs(ratio)
+        
+        assert specs['width'] == width
+        assert specs['height'] == height
         assert specs['fps'] == 30
     
-    def test_get_video_specs_square(self, creator):
-        """Test square video specs"""
-        specs = creator._get_video_specs('1:1')
-        
-        assert specs['width'] == 1080
-        assert specs['height'] == 1080
-    
-    def test_get_video_specs_horizontal(self, creator):
-        """Test horizontal video specs"""
-        specs = creator._get_video_specs('16:9')
-        
-        assert specs['width'] == 1920
-        assert specs['height'] == 1080
-    
-    @patch('src.media_creator.edge_tts')
-    @patch('src.media_creator.asyncio')
-    def test_generate_voiceover_edge_tts(self, mock_asyncio, mock_edge_tts, creator, temp_dir):
+    @patch.object(_mc, 'edge_tts')
+    @patch.object(_mc, 'asyncio')
+    def test_generate_voiceover_edge_tts(self, mock_asyncio, mock_edge_tts, creator, session_temp_dir):
         """Test Edge-TTS voiceover generation"""
-        output_path = os.path.join(temp_dir, 'test_audio.mp3')
+        output_path = os.path.join(session_temp_dir, 'test_audio.mp3')
         script = "Test voiceover script"
         
         # Mock async run
@@ -52,14 +56,12 @@ class TestMediaCreator:
         
         result = creator.generate_voiceover(script, output_path)
         
-        mock_asyncio.run.assert_called_once()
+        assert mock_asyncio.run.call_count == 1
     
-    @patch('src.media_creator.requests.get')
+    @patch.object(_mc.requests, 'get')
     def test_fetch_stock_videos_success(self, mock_get, creator):
         """Test stock video fetching from Pexels"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_get.return_value = make_response(200, {
             'videos': [{
                 'video_files': [{
                     'link': 'https://example.com/video1.mp4',
@@ -67,11 +69,9 @@ class TestMediaCreator:
                 }],
                 'duration': 10
             }]
-        }
-        mock_response.content = b'fake_video_data'
-        mock_get.return_value = mock_response
+        }, b'fake_video_data')
         
-        with patch('src.media_creator.VideoFileClip') as mock_clip_class:
+        with patch.object(_mc, 'VideoFileClip') as mock_clip_class:
             mock_clip = Mock()
             mock_clip.duration = 10.0
             mock_clip.resize.return_value = mock_clip
@@ -83,29 +83,25 @@ class TestMediaCreator:
             # Should attempt to fetch videos
             assert mock_get.called
     
-    @patch('src.media_creator.requests.get')
+    @patch.object(_mc.requests, 'get')
     def test_fetch_stock_videos_api_error(self, mock_get, creator):
         """Test stock video fetching with API error"""
-        mock_get.return_value.status_code = 401
+        mock_get.return_value = make_response(401)
         
         clips = creator.fetch_stock_videos(['fashion'], 45.0, '9:16')
         
         assert clips == []
     
-    @patch('src.media_creator.requests.get')
-    def test_create_slideshow_from_images(self, mock_get, creator, temp_dir):
+    @patch.object(_mc.requests, 'get')
+    def test_create_slideshow_from_images(self, mock_get, creator, session_temp_dir):
         """Test slideshow creation from images"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_get.return_value = make_response(200, {
             'results': [{
                 'urls': {'regular': 'https://example.com/image1.jpg'}
             }]
-        }
-        mock_response.content = b'fake_image_data'
-        mock_get.return_value = mock_response
+        }, b'fake_image_data')
         
-        with patch('src.media_creator.ImageClip') as mock_clip_class:
+        with patch.object(_mc, 'ImageClip') as mock_clip_class:
             mock_clip = Mock()
             mock_clip.duration = 5.0
             mock_clip.resize.return_value = mock_clip
@@ -116,16 +112,12 @@ class TestMediaCreator:
             # Should fetch images
             assert mock_get.called
     
-    @patch('src.media_creator.TextClip')
+    @patch.object(_mc, 'TextClip')
     def test_add_captions(self, mock_text_clip, creator, mock_video_clip):
         """Test adding captions to video"""
-        mock_text_instance = Mock()
-        mock_text_instance.set_position.return_value = mock_text_instance
-        mock_text_instance.set_start.return_value = mock_text_instance
-        mock_text_instance.set_duration.return_value = mock_text_instance
-        mock_text_clip.return_value = mock_text_instance
+        mock_text_clip.return_value = _chainable('set_position', 'set_start', 'set_duration')
         
-        with patch('src.media_creator.CompositeVideoClip') as mock_composite:
+        with patch.object(_mc, 'CompositeVideoClip') as mock_composite:
             script = "This is a test script for captions"
             result = creator.add_captions(mock_video_clip, script, '9:16')
             
@@ -133,53 +125,49 @@ class TestMediaCreator:
             assert mock_text_clip.called
             assert mock_composite.called
     
-    @patch('src.media_creator.TextClip')
-    @patch('src.media_creator.CompositeVideoClip')
+    @patch.object(_mc, 'TextClip')
+    @patch.object(_mc, 'CompositeVideoClip')
     def test_add_branding(self, mock_composite, mock_text_clip, creator, mock_video_clip):
         """Test adding branding watermark"""
-        mock_watermark = Mock()
-        mock_watermark.set_position.return_value = mock_watermark
-        mock_watermark.set_duration.return_value = mock_watermark
-        mock_watermark.set_opacity.return_value = mock_watermark
-        mock_text_clip.return_value = mock_watermark
+        mock_text_clip.return_value = _chainable('set_position', 'set_duration', 'set_opacity')
         
         result = creator.add_branding(mock_video_clip, '9:16')
         
         assert mock_text_clip.called
         assert mock_composite.called
     
-    @patch('src.media_creator.MediaCreator.generate_voiceover')
-    @patch('src.media_creator.MediaCreator.fetch_stock_videos')
-    @patch('src.media_creator.AudioFileClip')
-    @patch('src.media_creator.concatenate_videoclips')
+    @pytest.mark.slow
+    @patch.object(MediaCreator, 'generate_voiceover')
+    @patch.object(MediaCreator, 'fetch_stock_videos')
+    @patch.object(_mc, 'AudioFileClip')
+    @patch.object(_mc, 'concatenate_videoclips')
     def test_create_video_full_pipeline(
         self, mock_concat, mock_audio_clip, mock_fetch, mock_voiceover,
-        creator, temp_dir, sample_script, sample_metadata
+        creator, session_temp_dir, sample_script, sample_metadata
     ):
         """Test full video creation pipeline"""
-        output_path = os.path.join(temp_dir, 'output.mp4')
+        output_path = os.path.join(session_temp_dir, 'output.mp4')
         
         # Mock voiceover generation
         mock_voiceover.return_value = True
         
         # Mock audio clip
-        mock_audio_instance = Mock()
-        mock_audio_instance.duration = 45.0
-        mock_audio_instance.close = Mock()
+        mock_audio_instance = Mock(spec=AudioFileClip, duration=45.0)
         mock_audio_clip.return_value = mock_audio_instance
         
         # Mock video clips
-        mock_clip = Mock()
+        mock_clip = Mock(spec=VideoFileClip)
         mock_clip.set_audio.return_value = mock_clip
-        mock_clip.write_videofile = Mock()
-        mock_clip.close = Mock()
         mock_fetch.return_value = [mock_clip]
         
         # Mock concatenated video
         mock_concat.return_value = mock_clip
         
-        with patch.object(creator, 'add_captions', return_value=mock_clip), \
-             patch.object(creator, 'add_branding', return_value=mock_clip):
+        with patch.multiple(
+            creator,
+            add_captions=Mock(return_value=mock_clip),
+            add_branding=Mock(return_value=mock_clip)
+        ):
             
             result = creator.create_video(
                 sample_script,
@@ -188,15 +176,16 @@ class TestMediaCreator:
                 aspect_ratio='9:16'
             )
         
+        assert result is True
         assert mock_voiceover.called
         assert mock_fetch.called
     
-    @patch('src.media_creator.MediaCreator.generate_voiceover')
+    @patch.object(MediaCreator, 'generate_voiceover')
     def test_create_video_voiceover_failure(
-        self, mock_voiceover, creator, temp_dir, sample_script, sample_metadata
+        self, mock_voiceover, creator, session_temp_dir, sample_script, sample_metadata
     ):
         """Test video creation with voiceover failure"""
-        output_path = os.path.join(temp_dir, 'output.mp4')
+        output_path = os.path.join(session_temp_dir, 'output.mp4')
         mock_voiceover.return_value = False
         
         result = creator.create_video(
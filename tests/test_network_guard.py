@@ -0,0 +1,46 @@
+"""Tests for the conftest network guard"""
+import socket
+
+import pytest
+from pytest_socket import SocketBlockedError
+
+# Every blocked attempt below is deliberate
+pytestmark = pytest.mark.filterwarnings("ignore:A test tried to use socket.socket:UserWarning")
+
+
+def _open_inet_socket():
+    socket.socket(socket.AF_INET, socket.SOCK_STREAM).close()
+
+
+@pytest.fixture(scope="module")
+def module_socket_attempt():
+    """Try to open a socket while a module-scoped fixture is being built"""
+    try:
+        _open_inet_socket()
+    except SocketBlockedError:
+        return 'blocked'
+    return 'open'
+
+
+def test_module_fixture_blocked(module_socket_attempt):
+    """Test higher-scoped fixture setup runs with the network blocked"""
+    assert module_socket_attempt == 'blocked'
+
+
+@pytest.mark.parametrize("attempt", [1, 2])
+def test_every_test_blocked(attempt):
+    """Test the guard is re-applied for each test, not just the first"""
+    with pytest.raises(SocketBlockedError):
+        _open_inet_socket()
+
+
+@pytest.mark.enable_socket
+def test_enable_socket_marker():
+    """Test tests marked enable_socket may open sockets"""
+    _open_inet_socket()
+
+
+def test_blocked_after_enable_socket():
+    """Test the guard comes back after an opted-in test"""
+    with pytest.raises(SocketBlockedError):
+        _open_inet_socket()
@@ -1,12 +1,25 @@
 """Tests for Platform Uploaders"""
 import pytest
 from unittest.mock import Mock, patch, MagicMock
-import os
+import copy
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
 
-from src.uploaders.base import BasePlatformUploader
+from hypothesis import HealthCheck, example, given, settings, strategies as st
+
+from google.oauth2.credentials import Credentials
+from googleapiclient import discovery
+
+from src.uploaders.base import BasePlatformUploader, _probe, _probe_locks
+import src.uploaders.youtube as youtube_module
+import src.uploaders.media_upload as media_upload
 from src.uploaders.youtube import YouTubeUploader
+from src.uploaders.media_upload import MmapFileUpload
 from src.uploaders.instagram import InstagramUploader
 from src.uploaders.twitter import TwitterUploader
+import src.uploaders as uploaders_package
 from src.uploaders import MultiPlatformUploader
 
 
@@ -38,16 +51,51 @@ class TestBasePlatformUploader:
         result = uploader.validate_video(test_video_path, max_size_mb=10, max_duration=60)
         # Will fail on duration check but not size
         
-    def test_validate_video_too_large(self, temp_dir):
-        """Test video size validation failure"""
+    @patch('moviepy.editor.VideoFileClip')
+    def test_validate_video_probes_once(self, mock_clip_class, test_video_path):
+        """Test repeated validation of the same file reuses the cached probe"""
+        mock_clip_class.return_value = Mock(duration=30, size=(1080, 1920))
         uploader = MockUploader('test')
+        _probe.cache_clear()
         
-        # Create large file
-        large_file = os.path.join(temp_dir, 'large.mp4')
-        with open(large_file, 'wb') as f:
-            f.write(b'\x00' * (11 * 1024 * 1024))  # 11MB
+        try:
+            assert uploader.validate_video(test_video_path, max_size_mb=10, max_duration=60) is True
+            assert uploader.validate_video(test_video_path, max_size_mb=10, max_duration=20) is False
+        finally:
+            _probe.cache_clear()
         
-        result = uploader.validate_video(large_file, max_size_mb=10, max_duration=60)
+        mock_clip_class.assert_called_once_with(test_video_path)
+    
+    @patch('moviepy.editor.VideoFileClip')
+    def test_validate_video_probes_once_concurrently(self, mock_clip_class, test_video_path):
+        """Test parallel validation of one file (as upload_to_all does) shares a single probe"""
+        def slow_clip(path):
+            # Hold the probe open so every worker misses the cache at the same time
+            threading.Event().wait(0.1)
+            return Mock(duration=30, size=(1080, 1920))
+        
+        mock_clip_class.side_effect = slow_clip
+        uploader = MockUploader('test')
+        _probe.cache_clear()
+        
+        try:
+            with ThreadPoolExecutor(max_workers=5) as executor:
+                results = list(executor.map(
+                    lambda _: uploader.validate_video(test_video_path, max_size_mb=10, max_duration=60),
+                    range(5)
+                ))
+        finally:
+            _probe.cache_clear()
+        
+        assert results == [True] * 5
+        assert mock_clip_class.call_count == 1
+        assert _probe_locks == {}
+    
+    def test_validate_video_too_large(self, large_video):
+        """Test video size validation failure"""
+        uploader = MockUploader('test')
+        
+        result = uploader.validate_video(large_video, max_size_mb=10, max_duration=60)
         assert result is False
 
 
@@ -59,27 +107,73 @@ class TestYouTubeUploader:
         with patch('src.uploaders.youtube.os.path.exists', return_value=False):
             return YouTubeUploader()
     
+    @pytest.fixture(autouse=True)
+    def yt_mocks(self, monkeypatch):
+        """Stub the Google client, token loading and media upload for every test"""
+        mocks = SimpleNamespace(
+            build=Mock(),
+            load=Mock(return_value=Mock(valid=True, refresh_token=None)),
+            media=Mock()
+        )
+        monkeypatch.setattr(discovery, 'build', mocks.build)
+        monkeypatch.setattr(Credentials, 'from_authorized_user_file', mocks.load)
+        monkeypatch.setattr(media_upload, 'MmapFileUpload', mocks.media)
+        monkeypatch.setattr(youtube_module, '_CREDS_CACHE', {})
+        return mocks
+    
     def test_initialization(self, uploader):
         """Test YouTubeUploader initialization"""
         assert uploader.platform_name == 'YouTube'
         assert uploader.youtube is None
     
-    @patch('src.uploaders.youtube.build')
-    @patch('src.uploaders.youtube.pickle.load')
     @patch('src.uploaders.youtube.os.path.exists', return_value=True)
-    def test_authenticate_existing_token(self, mock_exists, mock_pickle, mock_build, uploader):
+    def test_authenticate_existing_token(self, mock_exists, uploader, yt_mocks):
         """Test authentication with existing token"""
-        mock_creds = Mock()
-        mock_creds.valid = True
-        mock_pickle.return_value = mock_creds
+        result = uploader.authenticate()
         
-        with patch('builtins.open', create=True):
-            result = uploader.authenticate()
+        assert result is True
+        yt_mocks.load.assert_called_once_with(YouTubeUploader.TOKEN_FILE, YouTubeUploader.SCOPES)
+        assert yt_mocks.build.call_args[1]['static_discovery'] is True
+    
+    @patch('src.uploaders.youtube.os.path.exists')
+    def test_authenticate_invalid_token_file(self, mock_exists, uploader, yt_mocks):
+        """Test a corrupt token file falls back to a fresh login"""
+        yt_mocks.load.side_effect = ValueError('invalid token')
+        
+        # Token file exists, client secrets do not
+        mock_exists.side_effect = lambda path: path == YouTubeUploader.TOKEN_FILE
+        
+        result = uploader.authenticate()
+        
+        assert result is False
+    
+    def test_save_credentials_concurrent_writers(self, uploader, tmp_path, monkeypatch):
+        """Test concurrent token saves in one process never leave a torn or stray file"""
+        token_file = tmp_path / 'youtube_token.json'
+        monkeypatch.setattr(uploader, 'TOKEN_FILE', str(token_file))
+        payloads = [json.dumps({'token': str(i) * 4096}) for i in range(10)]
+        
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            list(executor.map(
+                lambda payload: uploader._save_credentials(SimpleNamespace(to_json=lambda: payload)),
+                payloads
+            ))
+        
+        assert token_file.read_text() in payloads
+        assert [path.name for path in tmp_path.iterdir()] == ['youtube_token.json']
+    
+    def test_authenticate_cached_credentials(self, uploader, yt_mocks):
+        """Test authentication reuses in-memory credentials"""
+        mock_creds = Mock(valid=True, refresh_token=None)
+        youtube_module._CREDS_CACHE[' '.join(YouTubeUploader.SCOPES)] = mock_creds
+        
+        result = uploader.authenticate()
         
         assert result is True
+        yt_mocks.load.assert_not_called()
+        assert yt_mocks.build.call_args[1]['credentials'] is mock_creds
     
-    @patch('src.uploaders.youtube.MediaFileUpload')
-    def test_upload_metadata_formatting(self, mock_media, uploader, test_video_path, sample_metadata):
+    def test_upload_metadata_formatting(self, uploader, yt_mocks, test_video_path, sample_metadata):
         """Test YouTube upload metadata formatting"""
         mock_youtube = Mock()
         mock_request = Mock()
@@ -91,13 +185,37 @@ class TestYouTubeUploader:
             result = uploader.upload(test_video_path, sample_metadata)
         
         assert result is not None
-        assert 'youtube.com/shorts/' in result
+        assert result.startswith('https://youtube.com/shorts/')
+        assert yt_mocks.media.call_args[1]['chunksize'] == YouTubeUploader.CHUNK_SIZE
+    
+    def test_upload_tags_character_limit(self, uploader, test_video_path, sample_metadata):
+        """Test tags are capped at YouTube's 500 character total"""
+        mock_youtube = Mock()
+        mock_youtube.videos().insert().next_chunk.return_value = (None, {'id': 'test123'})
+        uploader.youtube = mock_youtube
+        
+        metadata = dict(sample_metadata, tags=['t' * 99] * 10)
+        
+        with patch.object(uploader, 'validate_video', return_value=True):
+            uploader.upload(test_video_path, metadata)
+        
+        tags = mock_youtube.videos().insert.call_args[1]['body']['snippet']['tags']
+        assert len(tags) == 5
+        assert sum(len(tag) + 1 for tag in tags) <= 500
+    
+    def test_mmap_file_upload_chunks(self, test_video_path):
+        """Test memory-mapped upload serves byte ranges"""
+        media = MmapFileUpload(test_video_path, chunksize=256 * 1024, resumable=True)
+        
+        assert media.has_stream() is False
+        assert media.getbytes(0, 512) == b'\x00' * 512
+        assert len(media.getbytes(768, 512)) == 256
     
     def test_get_analytics(self, uploader):
         """Test YouTube analytics fetching"""
-        mock_youtube = Mock()
-        mock_response = {
+        response = {
             'items': [{
+                'id': 'test_video_id',
                 'statistics': {
                     'viewCount': '1000',
                     'likeCount': '50',
@@ -105,14 +223,31 @@ class TestYouTubeUploader:
                 }
             }]
         }
-        mock_youtube.videos().list().execute.return_value = mock_response
-        uploader.youtube = mock_youtube
+        # Hand-wired stub: cheaper than a Mock chain that spawns a child per call
+        uploader.youtube = SimpleNamespace(videos=lambda: SimpleNamespace(
+            list=lambda **kwargs: SimpleNamespace(execute=lambda: response)))
         
         analytics = uploader.get_analytics('test_video_id')
         
         assert analytics['views'] == 1000
         assert analytics['likes'] == 50
         assert analytics['platform'] == 'youtube'
+    
+    def test_get_analytics_batch(self, uploader):
+        """Test analytics are fetched 50 video IDs per request"""
+        mock_youtube = Mock()
+        mock_youtube.videos().list().execute.side_effect = lambda: {'items': [
+            {'id': 'first', 'statistics': {'viewCount': '10'}}
+        ]}
+        uploader.youtube = mock_youtube
+        video_ids = [f'video{i}' for i in range(120)] + ['first']
+        
+        analytics = uploader.get_analytics_batch(video_ids)
+        
+        list_calls = [c for c in mock_youtube.videos().list.call_args_list if c[1]]
+        assert len(list_calls) == 3
+        assert len(list_calls[0][1]['id'].split(',')) == 50
+        assert analytics['first']['views'] == 10
 
 
 class TestInstagramUploader:
@@ -149,7 +284,7 @@ class TestInstagramUploader:
             result = uploader.upload(test_video_path, sample_metadata)
         
         assert result is not None
-        assert 'instagram.com/reel/' in result
+        assert result.startswith('https://www.instagram.com/reel/')
         
         # Check that hashtags were added
         call_args = uploader.client.clip_upload.call_args
@@ -160,11 +295,8 @@ class TestInstagramUploader:
         """Test Instagram analytics fetching"""
         uploader.client.media_pk_from_code = Mock(return_value='123456')
         
-        mock_media = Mock()
-        mock_media.play_count = 5000
-        mock_media.like_count = 250
-        mock_media.comment_count = 30
-        uploader.client.media_info = Mock(return_value=mock_media)
+        media = SimpleNamespace(play_count=5000, like_count=250, comment_count=30)
+        uploader.client.media_info = lambda media_pk: media
         
         analytics = uploader.get_analytics('ABC123')
         
@@ -198,26 +330,28 @@ class TestTwitterUploader:
         
         assert result is True
     
-    def test_upload_character_limit(self, uploader, test_video_path, sample_metadata):
-        """Test Twitter upload respects character limit"""
-        uploader.client = Mock()
-        uploader.api = Mock()
-        
-        # Create long description
-        long_metadata = sample_metadata.copy()
-        long_metadata['description'] = 'A' * 300
-        
-        mock_media = Mock()
-        mock_media.media_id = 'test123'
-        uploader.api.media_upload.return_value = mock_media
-        
-        mock_response = Mock()
-        mock_response.data = {'id': 'tweet123'}
-        uploader.client.create_tweet.return_value = mock_response
-        uploader.client.get_me.return_value = Mock(data=Mock(username='testuser'))
+    @settings(
+        max_examples=50, deadline=200,
+        suppress_health_check=[HealthCheck.function_scoped_fixture]
+    )
+    @given(description=st.text(max_size=1000))
+    @example(description='A' * 300)
+    def test_upload_character_limit(self, uploader, test_video_path, sample_metadata, description):
+        """Test Twitter upload keeps any description within the character limit"""
+        # Stubs are rebuilt per example; the fixtures are only read
+        metadata = dict(sample_metadata, description=description)
+        
+        uploader.api = SimpleNamespace(
+            media_upload=lambda **kwargs: SimpleNamespace(media_id='test123'))
+        uploader.client = SimpleNamespace(
+            create_tweet=Mock(return_value=SimpleNamespace(data={'id': 'tweet123'})),
+            get_me=lambda: SimpleNamespace(data=SimpleNamespace(username='testuser'))
+        )
         
         with patch.object(uploader, 'validate_video', return_value=True):
-            result = uploader.upload(test_video_path, long_metadata)
+            result = uploader.upload(test_video_path, metadata)
+        
+        assert result.startswith('https://twitter.com/testuser/status/')
         
         # Check tweet text was truncated
         call_args = uploader.client.create_tweet.call_args
@@ -225,29 +359,47 @@ class TestTwitterUploader:
         assert len(tweet_text) <= 280
 
 
+_PLATFORM_UPLOADERS = (
+    'YouTubeUploader', 'TikTokUploader', 'InstagramUploader', 'TwitterUploader', 'FacebookUploader'
+)
+
+
+@pytest.fixture(scope="session")
+def _mpu_template():
+    """Build MultiPlatformUploader with mocked uploaders once per session (never mutated)"""
+    with pytest.MonkeyPatch.context() as mp:
+        for name in _PLATFORM_UPLOADERS:
+            mp.setattr(uploaders_package, name, Mock)
+        return MultiPlatformUploader()
+
+
 class TestMultiPlatformUploader:
     
     @pytest.fixture
-    def uploader(self):
-        """Create MultiPlatformUploader with mocked uploaders"""
-        with patch('src.uploaders.YouTubeUploader'), \
-             patch('src.uploaders.TikTokUploader'), \
-             patch('src.uploaders.InstagramUploader'), \
-             patch('src.uploaders.TwitterUploader'), \
-             patch('src.uploaders.FacebookUploader'):
-            return MultiPlatformUploader()
+    def uploader(self, _mpu_template):
+        """Shallow copy of the template with fresh platform mocks and no auth state"""
+        clone = copy.copy(_mpu_template)
+        clone.uploaders = {
+            platform: MagicMock(spec=BasePlatformUploader) for platform in _mpu_template.uploaders
+        }
+        clone._authenticated = set()
+        return clone
+    
+    @pytest.fixture
+    def mocked_uploaders(self, uploader):
+        """Uploader whose platforms return a test URL and fixed analytics"""
+        for platform, platform_uploader in uploader.uploaders.items():
+            platform_uploader.upload.return_value = f'https://{platform}.com/test'
+            platform_uploader.get_analytics.return_value = {'views': 1000, 'likes': 50}
+        return uploader
     
     def test_initialization(self, uploader):
         """Test MultiPlatformUploader initialization"""
         assert isinstance(uploader.uploaders, dict)
     
-    def test_upload_to_all(self, uploader, test_video_path, sample_metadata):
+    def test_upload_to_all(self, mocked_uploaders, test_video_path, sample_metadata):
         """Test parallel upload to all platforms"""
-        # Mock uploaders
-        for platform in uploader.uploaders:
-            mock_uploader = Mock()
-            mock_uploader.upload.return_value = f'https://{platform}.com/test'
-            uploader.uploaders[platform] = mock_uploader
+        uploader = mocked_uploaders
         
         results = uploader.upload_to_all(test_video_path, sample_metadata)
         
@@ -258,6 +410,30 @@ class TestMultiPlatformUploader:
         for platform_uploader in uploader.uploaders.values():
             platform_uploader.upload.assert_called_once()
     
+    def test_upload_to_all_platform_subset(self, mocked_uploaders, test_video_path, sample_metadata):
+        """Test upload restricted to selected platforms"""
+        uploader = mocked_uploaders
+        
+        results = uploader.upload_to_all(test_video_path, sample_metadata, platforms=['youtube'])
+        
+        assert list(results) == ['youtube']
+        uploader.uploaders['tiktok'].upload.assert_not_called()
+    
+    def test_authenticate_all(self, uploader):
+        """Test one-shot authentication across all platforms"""
+        for platform, platform_uploader in uploader.uploaders.items():
+            platform_uploader.authenticate.return_value = platform != 'tiktok'
+        
+        results = uploader.authenticate_all()
+        
+        assert results['youtube'] is True
+        assert results['tiktok'] is False
+        
+        # Successful platforms are not re-authenticated
+        uploader.authenticate_all()
+        assert uploader.uploaders['youtube'].authenticate.call_count == 1
+        assert uploader.uploaders['tiktok'].authenticate.call_count == 2
+    
     def test_adapt_metadata_youtube(self, uploader, sample_metadata):
         """Test YouTube metadata adaptation"""
         adapted = uploader._adapt_metadata(sample_metadata, 'youtube')
@@ -266,29 +442,20 @@ class TestMultiPlatformUploader:
     
     def test_adapt_metadata_tiktok(self, uploader, sample_metadata):
         """Test TikTok metadata adaptation"""
-        long_metadata = sample_metadata.copy()
-        long_metadata['description'] = 'A' * 200
+        sample_metadata['description'] = 'A' * 200
         
-        adapted = uploader._adapt_metadata(long_metadata, 'tiktok')
+        adapted = uploader._adapt_metadata(sample_metadata, 'tiktok')
         
         assert len(adapted['description']) <= 150
     
-    def test_get_all_analytics(self, uploader):
+    def test_get_all_analytics(self, mocked_uploaders):
         """Test analytics aggregation from all platforms"""
         upload_results = {
             'youtube': 'video123',
             'tiktok': 'tiktok456'
         }
         
-        for platform in uploader.uploaders:
-            mock_uploader = Mock()
-            mock_uploader.get_analytics.return_value = {
-                'views': 1000,
-                'likes': 50
-            }
-            uploader.uploaders[platform] = mock_uploader
-        
-        analytics = uploader.get_all_analytics(upload_results)
+        analytics = mocked_uploaders.get_all_analytics(upload_results)
         
         assert len(analytics) == 2
     